@@ -1,14 +1,53 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import trino
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 
+from trino_connection import fetch_arrow_table, sibling_connection
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 DEFAULT_FILL_VALUE = 0.0
 DEFAULT_BATCH_SIZE = 1000
+NUMERIC_COLUMNS = ('revenue', 'orders_cnt', 'paid_amount', 'payments_cnt')
+DASHBOARD_SUMMARY_COLUMNS = (
+    'n_days', 'revenue_mean', 'revenue_max', 'revenue_sum',
+    'orders_mean', 'orders_sum', 'coverage_mean', 'n_full_coverage'
+)
+
+DAILY_ANALYTICS_QUERY = f"""
+    SELECT 
+        COALESCE(o.dt, p.dt) as dt,
+        COALESCE(o.revenue, {DEFAULT_FILL_VALUE}) as revenue,
+        COALESCE(o.orders_cnt, 0) as orders_cnt,
+        COALESCE(p.payments_cnt, 0) as payments_cnt,
+        COALESCE(p.paid_amount, {DEFAULT_FILL_VALUE}) as paid_amount,
+        LEAST(
+            1.0,
+            CASE WHEN o.revenue > 0 THEN COALESCE(p.paid_amount, 0.0) / o.revenue ELSE 0.0 END
+        ) as payment_coverage
+    FROM (
+        SELECT 
+            DATE(order_ts) as dt,
+            CAST(SUM(total_amount) AS DOUBLE) as revenue,
+            COUNT(*) as orders_cnt
+        FROM postgresql.public.trn_orders
+        GROUP BY DATE(order_ts)
+    ) o
+    FULL OUTER JOIN (
+        SELECT 
+            DATE(paid_at) as dt,
+            CAST(SUM(amount) AS DOUBLE) as paid_amount,
+            COUNT(*) as payments_cnt
+        FROM mysql.demo_db.trn_payments
+        GROUP BY DATE(paid_at)
+    ) p ON o.dt = p.dt
+"""
 
 
 def aggregate_daily_orders(connection: trino.dbapi.Connection) -> pd.DataFrame:
@@ -27,7 +66,7 @@ def aggregate_daily_orders(connection: trino.dbapi.Connection) -> pd.DataFrame:
     query = """
     SELECT 
         DATE(order_ts) as dt,
-        SUM(total_amount) as revenue,
+        CAST(SUM(total_amount) AS DOUBLE) as revenue,
         COUNT(*) as orders_cnt
     FROM postgresql.public.trn_orders
     GROUP BY DATE(order_ts)
@@ -38,13 +77,7 @@ def aggregate_daily_orders(connection: trino.dbapi.Connection) -> pd.DataFrame:
     
     try:
         cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        rows = cursor.fetchall()
-        df = pd.DataFrame(rows, columns=columns)
-        
-        df['dt'] = pd.to_datetime(df['dt']).dt.date
-        df['revenue'] = pd.to_numeric(df['revenue'], errors='coerce')
-        df['orders_cnt'] = pd.to_numeric(df['orders_cnt'], errors='coerce')
+        df = fetch_arrow_table(cursor).to_pandas(types_mapper=pd.ArrowDtype)
         
         logger.info(f"Aggregated {len(df)} days of order data")
         return df
@@ -72,7 +105,7 @@ def aggregate_daily_payments(connection: trino.dbapi.Connection) -> pd.DataFrame
     query = """
     SELECT 
         DATE(paid_at) as dt,
-        SUM(amount) as paid_amount,
+        CAST(SUM(amount) AS DOUBLE) as paid_amount,
         COUNT(*) as payments_cnt
     FROM mysql.demo_db.trn_payments
     GROUP BY DATE(paid_at)
@@ -83,13 +116,7 @@ def aggregate_daily_payments(connection: trino.dbapi.Connection) -> pd.DataFrame
     
     try:
         cursor.execute(query)
-        columns = [desc[0] for desc in cursor.description]
-        rows = cursor.fetchall()
-        df = pd.DataFrame(rows, columns=columns)
-        
-        df['dt'] = pd.to_datetime(df['dt']).dt.date
-        df['paid_amount'] = pd.to_numeric(df['paid_amount'], errors='coerce')
-        df['payments_cnt'] = pd.to_numeric(df['payments_cnt'], errors='coerce')
+        df = fetch_arrow_table(cursor).to_pandas(types_mapper=pd.ArrowDtype)
         
         logger.info(f"Aggregated {len(df)} days of payment data")
         return df
@@ -101,6 +128,38 @@ def aggregate_daily_payments(connection: trino.dbapi.Connection) -> pd.DataFrame
         cursor.close()
 
 
+def _run_on_sibling_connection(connection: trino.dbapi.Connection, func, *args):
+    """
+    Run func on a connection borrowed from the same pool as connection.
+    """
+    with sibling_connection(connection) as sibling:
+        return func(sibling, *args)
+
+
+def aggregate_daily_orders_and_payments(
+    connection: trino.dbapi.Connection
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Aggregate daily orders and payments concurrently.
+    
+    Both aggregations hit different catalogs and spend most of their time waiting
+    on Trino, so they run in parallel threads on connections borrowed from
+    the same pool.
+    
+    Args:
+        connection: Active Trino connection
+        
+    Returns:
+        Tuple of (orders DataFrame, payments DataFrame) as returned by
+        aggregate_daily_orders and aggregate_daily_payments
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        orders_future = executor.submit(_run_on_sibling_connection, connection, aggregate_daily_orders)
+        payments_future = executor.submit(_run_on_sibling_connection, connection, aggregate_daily_payments)
+        
+        return orders_future.result(), payments_future.result()
+
+
 def merge_dataframes_with_fillna(
     orders_df: pd.DataFrame,
     payments_df: pd.DataFrame,
@@ -129,13 +188,14 @@ def merge_dataframes_with_fillna(
             orders_df,
             payments_df,
             on=merge_key,
-            how='outer'
+            how='outer',
+            sort=True
         )
         
-        numeric_columns = merged_df.select_dtypes(include=['number']).columns
-        merged_df[numeric_columns] = merged_df[numeric_columns].fillna(fill_value)
-        
-        merged_df = merged_df.sort_values(merge_key).reset_index(drop=True)
+        merged_df.fillna(
+            {col: fill_value for col in NUMERIC_COLUMNS if col in merged_df.columns},
+            inplace=True
+        )
         
         logger.info(f"Merged DataFrames: {len(merged_df)} total rows")
         logger.info(f"Filled missing values with {fill_value}")
@@ -164,18 +224,15 @@ def calculate_payment_coverage(merged_df: pd.DataFrame) -> pd.DataFrame:
         raise ValueError(f"Missing required columns: {missing_columns}")
     
     try:
-        result_df = merged_df.copy()
-        
-        result_df['payment_coverage'] = result_df.apply(
-            lambda row: (
-                row['paid_amount'] / row['revenue'] 
-                if row['revenue'] > 0 
-                else 0.0
-            ),
-            axis=1
-        )
+        result_df = merged_df.copy(deep=False)
+        
+        revenue = result_df['revenue'].to_numpy(dtype=np.float64)
+        paid_amount = result_df['paid_amount'].to_numpy(dtype=np.float64)
         
-        result_df['payment_coverage'] = result_df['payment_coverage'].clip(upper=1.0)
+        coverage = np.divide(paid_amount, revenue, out=np.zeros_like(paid_amount), where=revenue > 0)
+        np.minimum(coverage, 1.0, out=coverage)
+        
+        result_df['payment_coverage'] = pd.array(coverage, dtype=pd.ArrowDtype(pa.float64()))
         
         logger.info("Payment coverage calculated successfully")
         logger.info(f"Average payment coverage: {result_df['payment_coverage'].mean():.2%}")
@@ -191,6 +248,9 @@ def create_final_analytics_dataframe(connection: trino.dbapi.Connection) -> pd.D
     """
     Create the final analytics DataFrame by aggregating and merging all data.
     
+    Orders and payments are aggregated, joined and scored in a single Trino query,
+    so only the final per-day rows are transferred to the client.
+    
     Args:
         connection: Active Trino connection
         
@@ -203,21 +263,17 @@ def create_final_analytics_dataframe(connection: trino.dbapi.Connection) -> pd.D
         - paid_amount: Total amount paid per day
         - payment_coverage: Payment coverage ratio (paid_amount/revenue)
     """
+    query = f"""
+    {DAILY_ANALYTICS_QUERY}
+    ORDER BY dt
+    """
+    
+    cursor = connection.cursor()
+    
     try:
-        logger.info("Step 1: Aggregating daily orders...")
-        orders_df = aggregate_daily_orders(connection)
-        
-        logger.info("Step 2: Aggregating daily payments...")
-        payments_df = aggregate_daily_payments(connection)
-        
-        logger.info("Step 3: Merging DataFrames...")
-        merged_df = merge_dataframes_with_fillna(orders_df, payments_df)
-        
-        logger.info("Step 4: Calculating payment coverage...")
-        final_df = calculate_payment_coverage(merged_df)
-        
-        column_order = ['dt', 'revenue', 'orders_cnt', 'payments_cnt', 'paid_amount', 'payment_coverage']
-        final_df = final_df[column_order]
+        logger.info("Aggregating, merging and scoring daily data in Trino...")
+        cursor.execute(query)
+        final_df = fetch_arrow_table(cursor).to_pandas(types_mapper=pd.ArrowDtype)
         
         logger.info(f"Final analytics DataFrame created with {len(final_df)} rows")
         logger.info(f"Date range: {final_df['dt'].min()} to {final_df['dt'].max()}")
@@ -227,6 +283,67 @@ def create_final_analytics_dataframe(connection: trino.dbapi.Connection) -> pd.D
     except Exception as e:
         logger.error(f"Failed to create final analytics DataFrame: {e}")
         raise RuntimeError(f"Could not create final analytics DataFrame: {e}")
+    finally:
+        cursor.close()
+
+
+def fetch_dashboard_data(connection: trino.dbapi.Connection) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Fetch the per-day analytics rows together with the dashboard summary.
+    
+    The summary figures are computed by Trino as window aggregates over the
+    same daily result, so the federated join runs once and the summary always
+    describes the rows that are plotted. Pass the summary as the stats
+    argument of create_combined_analytics_dashboard or save_all_charts to skip
+    recomputing it in pandas.
+    
+    Args:
+        connection: Active Trino connection
+        
+    Returns:
+        Tuple of (final analytics DataFrame, summary dict keyed by
+        DASHBOARD_SUMMARY_COLUMNS, matching the fields of
+        visualization.ChartStats)
+    """
+    query = f"""
+    WITH daily AS ({DAILY_ANALYTICS_QUERY})
+    SELECT 
+        daily.*,
+        COUNT(*) OVER () as n_days,
+        AVG(revenue) OVER () as revenue_mean,
+        MAX(revenue) OVER () as revenue_max,
+        SUM(revenue) OVER () as revenue_sum,
+        AVG(CAST(orders_cnt AS DOUBLE)) OVER () as orders_mean,
+        SUM(orders_cnt) OVER () as orders_sum,
+        AVG(payment_coverage) OVER () as coverage_mean,
+        COUNT_IF(payment_coverage >= 1.0) OVER () as n_full_coverage
+    FROM daily
+    ORDER BY dt
+    """
+    
+    cursor = connection.cursor()
+    
+    try:
+        logger.info("Fetching dashboard data with Trino-side summary aggregates...")
+        cursor.execute(query)
+        result_table = fetch_arrow_table(cursor)
+        
+        summary_columns = list(DASHBOARD_SUMMARY_COLUMNS)
+        if result_table.num_rows == 0:
+            summary = dict.fromkeys(summary_columns, 0)
+        else:
+            summary = result_table.select(summary_columns).slice(0, 1).to_pylist()[0]
+        
+        final_df = result_table.drop_columns(summary_columns).to_pandas(types_mapper=pd.ArrowDtype)
+        
+        logger.info(f"Dashboard data fetched with {len(final_df)} rows")
+        return final_df, summary
+        
+    except Exception as e:
+        logger.error(f"Failed to fetch dashboard data: {e}")
+        raise RuntimeError(f"Could not fetch dashboard data: {e}")
+    finally:
+        cursor.close()
 
 
 def get_analytics_summary(df: pd.DataFrame) -> Dict[str, Any]:
@@ -249,6 +366,8 @@ def get_analytics_summary(df: pd.DataFrame) -> Dict[str, Any]:
         raise ValueError(f"Missing required columns: {missing_columns}")
     
     try:
+        stats = df[required_columns].agg(['sum', 'mean', 'max', 'min'])
+        
         summary = {
             'total_days': len(df),
             'date_range': {
@@ -256,27 +375,27 @@ def get_analytics_summary(df: pd.DataFrame) -> Dict[str, Any]:
                 'end': df['dt'].max()
             },
             'revenue': {
-                'total': float(df['revenue'].sum()),
-                'average_daily': float(df['revenue'].mean()),
-                'max_daily': float(df['revenue'].max()),
-                'min_daily': float(df['revenue'].min())
+                'total': float(stats.loc['sum', 'revenue']),
+                'average_daily': float(stats.loc['mean', 'revenue']),
+                'max_daily': float(stats.loc['max', 'revenue']),
+                'min_daily': float(stats.loc['min', 'revenue'])
             },
             'orders': {
-                'total': int(df['orders_cnt'].sum()),
-                'average_daily': float(df['orders_cnt'].mean()),
-                'max_daily': int(df['orders_cnt'].max()),
-                'min_daily': int(df['orders_cnt'].min())
+                'total': int(stats.loc['sum', 'orders_cnt']),
+                'average_daily': float(stats.loc['mean', 'orders_cnt']),
+                'max_daily': int(stats.loc['max', 'orders_cnt']),
+                'min_daily': int(stats.loc['min', 'orders_cnt'])
             },
             'payments': {
-                'total': int(df['payments_cnt'].sum()),
-                'total_amount': float(df['paid_amount'].sum()),
-                'average_daily_count': float(df['payments_cnt'].mean()),
-                'average_daily_amount': float(df['paid_amount'].mean())
+                'total': int(stats.loc['sum', 'payments_cnt']),
+                'total_amount': float(stats.loc['sum', 'paid_amount']),
+                'average_daily_count': float(stats.loc['mean', 'payments_cnt']),
+                'average_daily_amount': float(stats.loc['mean', 'paid_amount'])
             },
             'payment_coverage': {
-                'average': float(df['payment_coverage'].mean()),
-                'max': float(df['payment_coverage'].max()),
-                'min': float(df['payment_coverage'].min()),
+                'average': float(stats.loc['mean', 'payment_coverage']),
+                'max': float(stats.loc['max', 'payment_coverage']),
+                'min': float(stats.loc['min', 'payment_coverage']),
                 'days_with_full_coverage': int((df['payment_coverage'] >= 1.0).sum())
             }
         }
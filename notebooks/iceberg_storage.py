@@ -1,17 +1,118 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import trino
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Union
 import logging
-from datetime import datetime, date
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from trino_connection import fetch_arrow_table, sibling_connection
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 DEFAULT_SCHEMA = "analytics"
 DEFAULT_BATCH_SIZE = 1000
+DEFAULT_INSERT_WORKERS = 4
 DEFAULT_TABLE_FORMAT = "PARQUET"
 DEFAULT_COMPRESSION = "SNAPPY"
 
+DTYPE_KIND_TO_TRINO = {
+    'i': 'BIGINT',
+    'u': 'BIGINT',
+    'f': 'DOUBLE',
+    'b': 'BOOLEAN',
+    'M': 'TIMESTAMP(3)',
+    'O': 'VARCHAR',
+    'U': 'VARCHAR',
+}
+
+DTYPE_KIND_CLASSES = {
+    'i': 'int',
+    'u': 'int',
+    'f': 'float',
+    'b': 'bool',
+    'M': 'datetime',
+    'm': 'timedelta',
+    'O': 'object',
+    'U': 'object',
+    'S': 'object',
+}
+
+_known_schemas: "weakref.WeakKeyDictionary[trino.dbapi.Connection, Set[str]]" = weakref.WeakKeyDictionary()
+
+
+def _column_to_parameters(series: pd.Series) -> np.ndarray:
+    """
+    Convert a DataFrame column into Python objects accepted as Trino query parameters.
+    
+    Args:
+        series: Column to convert
+        
+    Returns:
+        Object ndarray with missing values replaced by None
+    """
+    values = series.to_numpy(dtype=object, copy=True)
+    
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iub':
+        return values
+    
+    missing_mask = series.isna().to_numpy()
+    if missing_mask.any():
+        values[missing_mask] = None
+    
+    return values
+
+
+def _fetch_all(
+    connection: trino.dbapi.Connection,
+    query: str,
+    parameters: Optional[List[Any]] = None
+) -> List[tuple]:
+    """
+    Execute a query on a dedicated cursor and fetch all rows.
+    
+    Args:
+        connection: Active Trino connection
+        query: SQL query to execute
+        parameters: Optional query parameters for parameterized queries
+        
+    Returns:
+        List of result rows
+    """
+    cursor = connection.cursor()
+    
+    try:
+        if parameters:
+            cursor.execute(query, parameters)
+        else:
+            cursor.execute(query)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def _fetch_all_on_sibling(
+    connection: trino.dbapi.Connection,
+    query: str,
+    parameters: Optional[List[Any]] = None
+) -> List[tuple]:
+    """
+    Execute a query on a connection borrowed from the same pool and fetch all rows.
+    
+    Args:
+        connection: Active Trino connection whose pool to borrow from
+        query: SQL query to execute
+        parameters: Optional query parameters for parameterized queries
+        
+    Returns:
+        List of result rows
+    """
+    with sibling_connection(connection) as sibling:
+        return _fetch_all(sibling, query, parameters)
+
 
 def create_iceberg_schema(
     connection: trino.dbapi.Connection,
@@ -27,18 +128,28 @@ def create_iceberg_schema(
     Returns:
         True if schema was created or already exists, False otherwise
     """
+    known_schemas = _known_schemas.setdefault(connection, set())
+    
+    if schema_name in known_schemas:
+        logger.info(f"Schema '{schema_name}' already exists in Iceberg catalog")
+        return True
+    
     cursor = connection.cursor()
     
     try:
-        cursor.execute("SHOW SCHEMAS FROM iceberg")
-        existing_schemas = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT schema_name FROM iceberg.information_schema.schemata WHERE schema_name = ?",
+            [schema_name]
+        )
         
-        if schema_name in existing_schemas:
+        if cursor.fetchall():
+            known_schemas.add(schema_name)
             logger.info(f"Schema '{schema_name}' already exists in Iceberg catalog")
             return True
         
         create_schema_query = f"CREATE SCHEMA IF NOT EXISTS iceberg.{schema_name}"
         cursor.execute(create_schema_query)
+        known_schemas.add(schema_name)
         
         logger.info(f"Schema '{schema_name}' created successfully in Iceberg catalog")
         return True
@@ -88,22 +199,15 @@ def create_iceberg_table_from_dataframe(
                 logger.warning(f"Could not drop table {full_table_name}: {e}")
         
         def map_dtype_to_trino(dtype, column_name):
-            dtype_str = str(dtype)
-            
-            if 'int' in dtype_str:
-                return 'BIGINT'
-            elif 'float' in dtype_str or 'double' in dtype_str:
-                return 'DOUBLE'
-            elif 'bool' in dtype_str:
-                return 'BOOLEAN'
-            elif 'datetime' in dtype_str or 'timestamp' in dtype_str:
-                return 'TIMESTAMP(3)'
-            elif 'date' in dtype_str:
+            if isinstance(dtype, pd.ArrowDtype) and pa.types.is_date(dtype.pyarrow_dtype):
                 return 'DATE'
-            elif column_name == 'dt':
+            
+            trino_type = DTYPE_KIND_TO_TRINO.get(dtype.kind, 'VARCHAR')
+            
+            if trino_type == 'VARCHAR' and column_name == 'dt':
                 return 'DATE'
-            else:
-                return 'VARCHAR'
+            
+            return trino_type
         
         column_definitions = []
         for column_name, dtype in df.dtypes.items():
@@ -140,17 +244,24 @@ def insert_dataframe_to_iceberg(
     df: pd.DataFrame,
     table_name: str,
     schema_name: str = DEFAULT_SCHEMA,
-    batch_size: int = DEFAULT_BATCH_SIZE
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_workers: int = DEFAULT_INSERT_WORKERS
 ) -> int:
     """
     Insert DataFrame data into an Iceberg table.
     
+    Batches are inserted concurrently on connections borrowed from the same
+    pool and each batch is committed as its own Iceberg snapshot. If a batch
+    fails, batches that have not started yet are cancelled. Use max_workers=1
+    to insert batches sequentially.
+    
     Args:
         connection: Active Trino connection
         df: DataFrame containing data to insert
         table_name: Name of the target table
         schema_name: Schema name in Iceberg catalog
         batch_size: Number of rows to insert per batch
+        max_workers: Maximum number of batches inserted in parallel
         
     Returns:
         Number of rows inserted
@@ -158,48 +269,53 @@ def insert_dataframe_to_iceberg(
     if df.empty:
         raise ValueError("DataFrame is empty")
     
-    cursor = connection.cursor()
     full_table_name = f"iceberg.{schema_name}.{table_name}"
     
     try:
-        def format_value(value):
-            if pd.isna(value):
-                return 'NULL'
-            elif isinstance(value, (date, datetime)):
-                return f"DATE '{value}'"
-            elif isinstance(value, str):
-                escaped_value = value.replace("'", "''")
-                return f"'{escaped_value}'"
-            elif isinstance(value, (int, float)):
-                return str(value)
-            else:
-                return f"'{str(value)}'"
+        insert_values = np.column_stack([_column_to_parameters(df[col]) for col in df.columns])
         
-        total_inserted = 0
+        columns_sql = ", ".join(df.columns)
+        row_placeholders = f"({', '.join(['?'] * len(df.columns))})"
+        insert_header = f"INSERT INTO {full_table_name} ({columns_sql})\nVALUES\n    "
+        
+        def build_insert_sql(row_count):
+            return insert_header + ",\n    ".join([row_placeholders] * row_count)
+        
+        full_batch_rows = min(batch_size, len(df))
+        full_batch_sql = build_insert_sql(full_batch_rows)
         
-        for start_idx in range(0, len(df), batch_size):
+        def insert_batch(start_idx):
             end_idx = min(start_idx + batch_size, len(df))
-            batch_df = df.iloc[start_idx:end_idx]
+            batch_size_actual = end_idx - start_idx
             
-            values_list = []
-            for _, row in batch_df.iterrows():
-                row_values = [format_value(value) for value in row]
-                values_list.append(f"({', '.join(row_values)})")
+            parameters = insert_values[start_idx:end_idx].ravel().tolist()
             
-            values_sql = ",\\n    ".join(values_list)
-            columns_sql = ", ".join(df.columns)
-            
-            insert_sql = f"""
-            INSERT INTO {full_table_name} ({columns_sql})
-            VALUES
-                {values_sql}
-            """
+            if batch_size_actual == full_batch_rows:
+                insert_sql = full_batch_sql
+            else:
+                insert_sql = build_insert_sql(batch_size_actual)
             
-            cursor.execute(insert_sql)
-            batch_size_actual = len(batch_df)
-            total_inserted += batch_size_actual
+            _fetch_all_on_sibling(connection, insert_sql, parameters)
+            return batch_size_actual
+        
+        total_inserted = 0
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(insert_batch, start_idx): start_idx
+                for start_idx in range(0, len(df), batch_size)
+            }
             
-            logger.info(f"Inserted batch {start_idx//batch_size + 1}: {batch_size_actual} rows")
+            try:
+                for future in as_completed(futures):
+                    batch_size_actual = future.result()
+                    total_inserted += batch_size_actual
+                    
+                    logger.info(f"Inserted batch {futures[future]//batch_size + 1}: {batch_size_actual} rows")
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
         
         logger.info(f"Successfully inserted {total_inserted} rows into {full_table_name}")
         return total_inserted
@@ -207,8 +323,6 @@ def insert_dataframe_to_iceberg(
     except Exception as e:
         logger.error(f"Failed to insert data into {full_table_name}: {e}")
         raise RuntimeError(f"Could not insert data into Iceberg table: {e}")
-    finally:
-        cursor.close()
 
 
 def query_iceberg_table(
@@ -252,16 +366,7 @@ def query_iceberg_table(
         
         cursor.execute(query)
         
-        columns = [desc[0] for desc in cursor.description] if cursor.description else []
-        rows = cursor.fetchall()
-        df = pd.DataFrame(rows, columns=columns)
-        
-        for col in df.columns:
-            if col == 'dt' or 'date' in col.lower():
-                try:
-                    df[col] = pd.to_datetime(df[col]).dt.date
-                except:
-                    pass
+        df = fetch_arrow_table(cursor).to_pandas(types_mapper=pd.ArrowDtype)
         
         logger.info(f"Queried {len(df)} rows from {full_table_name}")
         return df
@@ -307,19 +412,27 @@ def verify_data_persistence(
         }
         
         try:
-            for col in original_df.columns:
-                if col in persisted_df.columns:
-                    orig_type = str(original_df[col].dtype)
-                    pers_type = str(persisted_df[col].dtype)
-                    
-                    if 'int' in orig_type and 'int' in pers_type:
-                        continue
-                    elif 'float' in orig_type and ('float' in pers_type or 'int' in pers_type):
-                        continue
-                    elif col == 'dt':
-                        continue
-                    elif orig_type != pers_type:
-                        logger.warning(f"Type mismatch for column {col}: {orig_type} vs {pers_type}")
+            common_columns = [col for col in original_df.columns if col in persisted_df.columns]
+            
+            def dtype_class(dtype):
+                return DTYPE_KIND_CLASSES.get(dtype.kind, dtype.kind)
+            
+            orig_classes = original_df.dtypes[common_columns].map(dtype_class).to_numpy()
+            pers_classes = persisted_df.dtypes[common_columns].map(dtype_class).to_numpy()
+            
+            compatible = (
+                (orig_classes == pers_classes)
+                | ((orig_classes == 'float') & (pers_classes == 'int'))
+                | (np.array(common_columns) == 'dt')
+            )
+            
+            for col in np.array(common_columns)[~compatible]:
+                logger.warning(
+                    f"Type mismatch for column {col}: "
+                    f"{original_df[col].dtype} vs {persisted_df[col].dtype}"
+                )
+            
+            verification_results['data_types_compatible'] = bool(compatible.all())
         except Exception as e:
             verification_results['data_types_compatible'] = False
             logger.warning(f"Data type verification failed: {e}")
@@ -332,16 +445,18 @@ def verify_data_persistence(
                 orig_sample = original_df.sort_values(first_col).head(sample_size)
                 pers_sample = persisted_df.sort_values(first_col).head(sample_size)
                 
-                numeric_cols = original_df.select_dtypes(include=['number']).columns
-                for col in numeric_cols:
-                    if col in pers_sample.columns:
-                        orig_values = orig_sample[col].values
-                        pers_values = pers_sample[col].values
-                        
-                        if not pd.Series(orig_values).equals(pd.Series(pers_values)):
-                            if not all(abs(o - p) < 0.01 for o, p in zip(orig_values, pers_values)):
-                                verification_results['sample_data_match'] = False
-                                break
+                numeric_cols = [
+                    col for col in original_df.select_dtypes(include=['number']).columns
+                    if col in pers_sample.columns
+                ]
+                
+                if numeric_cols:
+                    orig_values = orig_sample[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+                    pers_values = pers_sample[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+                    
+                    verification_results['sample_data_match'] = bool(
+                        np.allclose(orig_values, pers_values, rtol=0.0, atol=0.01, equal_nan=True)
+                    )
         except Exception as e:
             verification_results['sample_data_match'] = False
             logger.warning(f"Sample data verification failed: {e}")
@@ -382,7 +497,6 @@ def get_iceberg_table_info(
     Returns:
         Dictionary with table information
     """
-    cursor = connection.cursor()
     full_table_name = f"iceberg.{schema_name}.{table_name}"
     
     try:
@@ -392,29 +506,41 @@ def get_iceberg_table_info(
             'table_name_short': table_name
         }
         
-        cursor.execute(f"DESCRIBE {full_table_name}")
-        columns_info = cursor.fetchall()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            columns_future = executor.submit(
+                _fetch_all_on_sibling,
+                connection,
+                """
+                SELECT column_name, data_type, is_nullable, comment
+                FROM iceberg.information_schema.columns
+                WHERE table_schema = ? AND table_name = ?
+                ORDER BY ordinal_position
+                """,
+                [schema_name, table_name]
+            )
+            count_future = executor.submit(_fetch_all_on_sibling, connection, f"SELECT COUNT(*) FROM {full_table_name}")
+            create_future = executor.submit(_fetch_all_on_sibling, connection, f"SHOW CREATE TABLE {full_table_name}")
+            
+            columns_info = columns_future.result()
+            row_count = count_future.result()[0][0]
+            
+            try:
+                create_statement = create_future.result()[0][0]
+            except Exception:
+                create_statement = None
         
         table_info['columns'] = [
             {
                 'name': row[0],
                 'type': row[1],
-                'nullable': row[2] if len(row) > 2 else None,
-                'comment': row[3] if len(row) > 3 else None
+                'nullable': row[2],
+                'comment': row[3]
             }
             for row in columns_info
         ]
         
-        cursor.execute(f"SELECT COUNT(*) FROM {full_table_name}")
-        row_count = cursor.fetchone()[0]
         table_info['row_count'] = row_count
-        
-        try:
-            cursor.execute(f"SHOW CREATE TABLE {full_table_name}")
-            create_statement = cursor.fetchone()[0]
-            table_info['create_statement'] = create_statement
-        except Exception:
-            table_info['create_statement'] = None
+        table_info['create_statement'] = create_statement
         
         logger.info(f"Retrieved information for table {full_table_name}")
         return table_info
@@ -422,8 +548,6 @@ def get_iceberg_table_info(
     except Exception as e:
         logger.error(f"Failed to get table information for {full_table_name}: {e}")
         raise RuntimeError(f"Could not get table information: {e}")
-    finally:
-        cursor.close()
 
 
 def save_analytics_to_iceberg(
@@ -488,32 +612,47 @@ def save_analytics_to_iceberg(
 
 def list_iceberg_tables(
     connection: trino.dbapi.Connection,
-    schema_name: str = DEFAULT_SCHEMA
-) -> pd.DataFrame:
+    schema_name: str = DEFAULT_SCHEMA,
+    return_as: str = 'dataframe'
+) -> Union[pd.DataFrame, List[str]]:
     """
     List all tables in the specified Iceberg schema.
     
     Args:
         connection: Active Trino connection
         schema_name: Schema name in Iceberg catalog
+        return_as: 'dataframe' for a DataFrame with a table_name column,
+            'list' for a plain list of table names
         
     Returns:
-        DataFrame with table information
+        DataFrame or list with table names
     """
+    if return_as not in ('dataframe', 'list'):
+        raise ValueError(f"Unsupported return_as value: '{return_as}'")
+    
     cursor = connection.cursor()
     
     try:
-        cursor.execute(f"SHOW TABLES FROM iceberg.{schema_name}")
-        tables = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT table_name
+            FROM iceberg.information_schema.tables
+            WHERE table_schema = ?
+            ORDER BY table_name
+            """,
+            [schema_name]
+        )
+        table_names = [row[0] for row in cursor.fetchall()]
         
-        if not tables:
+        if not table_names:
             logger.info(f"No tables found in schema iceberg.{schema_name}")
-            return pd.DataFrame(columns=['table_name'])
+        else:
+            logger.info(f"Found {len(table_names)} tables in schema iceberg.{schema_name}")
         
-        df = pd.DataFrame(tables, columns=['table_name'])
-        logger.info(f"Found {len(df)} tables in schema iceberg.{schema_name}")
+        if return_as == 'list':
+            return table_names
         
-        return df
+        return pd.DataFrame({'table_name': table_names})
         
     except Exception as e:
         logger.error(f"Failed to list tables in schema {schema_name}: {e}")
@@ -1,9 +1,23 @@
 import trino
 import pandas as pd
-from typing import List, Dict, Any, Optional
+import pyarrow as pa
+import requests
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Union, Literal, Callable, TYPE_CHECKING
 import logging
 import os
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    import polars
 
 load_dotenv()
 
@@ -15,6 +29,189 @@ DEFAULT_PORT = int(os.getenv('TRINO_PORT', '8080'))
 DEFAULT_USER = os.getenv('TRINO_USER', 'trino')
 DEFAULT_CATALOG = 'system'
 DEFAULT_SCHEMA = 'information_schema'
+DEFAULT_FETCH_SIZE = 10000
+DEFAULT_METADATA_FETCH_SIZE = 1000
+DEFAULT_POOL_SIZE = 8
+DEFAULT_VALIDATION_IDLE_SECONDS = 60
+DEFAULT_HTTP_POOL_CONNECTIONS = 16
+DEFAULT_HTTP_POOL_MAXSIZE = 32
+DEFAULT_HTTP_RETRIES = 3
+DEFAULT_HTTP_BACKOFF_FACTOR = 0.2
+DEFAULT_QUERY_CACHE_SIZE = 128
+DEFAULT_QUERY_CACHE_TTL_SECONDS = 60
+
+IDENTIFIER_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+TRINO_TO_ARROW_TYPES = {
+    'boolean': pa.bool_(),
+    'tinyint': pa.int8(),
+    'smallint': pa.int16(),
+    'integer': pa.int32(),
+    'bigint': pa.int64(),
+    'real': pa.float32(),
+    'double': pa.float64(),
+    'varchar': pa.string(),
+    'char': pa.string(),
+    'date': pa.date32(),
+    'timestamp': pa.timestamp('us'),
+    'time': pa.time64('us'),
+    'varbinary': pa.binary(),
+}
+
+TRINO_TO_PANDAS_TYPES = {
+    'boolean': 'boolean',
+    'tinyint': 'Int8',
+    'smallint': 'Int16',
+    'integer': 'Int32',
+    'bigint': 'Int64',
+    'real': 'float32',
+    'double': 'float64',
+    'decimal': 'float64',
+    'date': pd.ArrowDtype(pa.date32()),
+    'timestamp': 'datetime64[us]',
+}
+
+
+def _validate_connection(connection: trino.dbapi.Connection) -> None:
+    """
+    Run a lightweight query to make sure the connection is usable.
+    
+    Args:
+        connection: Trino connection to validate
+    """
+    cursor = connection.cursor()
+    
+    try:
+        cursor.execute("SELECT 1")
+        result = cursor.fetchone()
+    finally:
+        cursor.close()
+    
+    if result[0] != 1:
+        raise ConnectionError("Connection test failed")
+
+
+def _create_http_session() -> requests.Session:
+    """
+    Create a keep-alive HTTP session with connection pooling and retries.
+    
+    Returns:
+        requests.Session with a pooled, retrying adapter mounted for http and https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=DEFAULT_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=DEFAULT_HTTP_RETRIES, backoff_factor=DEFAULT_HTTP_BACKOFF_FACTOR)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class PooledTrinoConnection(trino.dbapi.Connection):
+    """
+    Trino connection that returns itself to its pool when closed.
+    """
+    
+    def __init__(self, pool: "_TrinoConnectionPool", **connect_kwargs):
+        super().__init__(**connect_kwargs)
+        self.pool = pool
+        self.last_used = time.monotonic()
+        self.idle = False
+    
+    def close(self) -> None:
+        self.pool.release(self)
+    
+    def close_physical(self) -> None:
+        # The HTTP session is shared by the whole pool and closed in close_all
+        if self._http_session is not self.pool.connect_kwargs.get('http_session'):
+            super().close()
+
+
+class _TrinoConnectionPool:
+    """
+    Bounded pool of idle Trino connections sharing the same connection settings.
+    """
+    
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, **connect_kwargs):
+        self.connect_kwargs = connect_kwargs
+        self._idle_connections = queue.Queue(maxsize=pool_size)
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> PooledTrinoConnection:
+        while True:
+            try:
+                connection = self._idle_connections.get_nowait()
+            except queue.Empty:
+                connection = PooledTrinoConnection(self, **self.connect_kwargs)
+                _validate_connection(connection)
+                return connection
+            
+            with self._lock:
+                connection.idle = False
+            
+            if time.monotonic() - connection.last_used <= DEFAULT_VALIDATION_IDLE_SECONDS:
+                return connection
+            
+            try:
+                _validate_connection(connection)
+                return connection
+            except Exception as e:
+                logger.warning(f"Discarding stale pooled Trino connection: {e}")
+                connection.close_physical()
+    
+    def release(self, connection: PooledTrinoConnection) -> None:
+        with self._lock:
+            if connection.idle:
+                return
+            connection.idle = True
+        
+        connection.last_used = time.monotonic()
+        
+        try:
+            self._idle_connections.put_nowait(connection)
+        except queue.Full:
+            connection.close_physical()
+    
+    def close_all(self) -> None:
+        while True:
+            try:
+                connection = self._idle_connections.get_nowait()
+            except queue.Empty:
+                break
+            connection.close_physical()
+        
+        self.connect_kwargs['http_session'].close()
+
+
+_connection_pools: Dict[Tuple[str, int, str, str, str], _TrinoConnectionPool] = {}
+_connection_pools_lock = threading.Lock()
+
+
+def _get_connection_pool(
+    host: str,
+    port: int,
+    user: str,
+    catalog: str,
+    schema: str
+) -> _TrinoConnectionPool:
+    """
+    Get the connection pool for the given connection settings, creating it if needed.
+    """
+    key = (host, port, user, catalog, schema)
+    
+    with _connection_pools_lock:
+        if key not in _connection_pools:
+            _connection_pools[key] = _TrinoConnectionPool(
+                host=host,
+                port=port,
+                user=user,
+                catalog=catalog,
+                schema=schema,
+                http_session=_create_http_session()
+            )
+        return _connection_pools[key]
 
 
 def create_trino_connection(
@@ -27,6 +224,9 @@ def create_trino_connection(
     """
     Establish a connection to Trino coordinator.
     
+    Connections are taken from a pool keyed by the connection settings. Closing the
+    returned connection hands it back to the pool instead of discarding it.
+    
     Args:
         host: Trino coordinator hostname
         port: Trino coordinator port
@@ -38,22 +238,8 @@ def create_trino_connection(
         Active Trino database connection
     """
     try:
-        connection = trino.dbapi.connect(
-            host=host,
-            port=port,
-            user=user,
-            catalog=catalog,
-            schema=schema
-        )
-        
-        cursor = connection.cursor()
-        cursor.execute("SELECT 1")
-        result = cursor.fetchone()
-        cursor.close()
+        connection = _get_connection_pool(host, port, user, catalog, schema).acquire()
         
-        if result[0] != 1:
-            raise ConnectionError("Connection test failed")
-            
         logger.info(f"Successfully connected to Trino at {host}:{port}")
         return connection
         
@@ -62,6 +248,295 @@ def create_trino_connection(
         raise ConnectionError(f"Could not establish connection to Trino: {e}")
 
 
+@contextmanager
+def get_connection(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    user: str = DEFAULT_USER,
+    catalog: str = DEFAULT_CATALOG,
+    schema: str = DEFAULT_SCHEMA
+) -> Iterator[trino.dbapi.Connection]:
+    """
+    Borrow a pooled Trino connection for the duration of a with-block.
+    
+    Args:
+        host: Trino coordinator hostname
+        port: Trino coordinator port
+        user: Username for authentication
+        catalog: Default catalog to connect to
+        schema: Default schema to use
+        
+    Yields:
+        Active Trino database connection
+    """
+    connection = create_trino_connection(host, port, user, catalog, schema)
+    
+    try:
+        yield connection
+    finally:
+        connection.close()
+
+
+@contextmanager
+def sibling_connection(connection: trino.dbapi.Connection) -> Iterator[trino.dbapi.Connection]:
+    """
+    Borrow another connection from the same pool for concurrent work.
+    
+    Connections that do not come from a pool are shared as-is; every query
+    still runs on its own cursor.
+    
+    Args:
+        connection: Connection whose pool to borrow from
+        
+    Yields:
+        Connection to run a concurrent query on
+    """
+    if not isinstance(connection, PooledTrinoConnection):
+        yield connection
+        return
+    
+    sibling = connection.pool.acquire()
+    
+    try:
+        yield sibling
+    finally:
+        sibling.close()
+
+
+def _split_type_arguments(arguments: str) -> List[str]:
+    """
+    Split the arguments of a parametric Trino type at top-level commas.
+    
+    Args:
+        arguments: Text between the outer parentheses, e.g. 'varchar, array(integer)'
+        
+    Returns:
+        List of stripped arguments
+    """
+    parts = []
+    depth = 0
+    quoted = False
+    current = []
+    
+    for char in arguments:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        elif not quoted and depth == 0 and char == ',':
+            parts.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    
+    parts.append(''.join(current).strip())
+    return parts
+
+
+def _split_row_field(field: str, position: int) -> Tuple[str, str]:
+    """
+    Split a row field declaration into its name and type.
+    
+    Args:
+        field: Field declaration, e.g. 'id integer', '"order id" bigint' or 'integer'
+        position: Field position, used to name anonymous fields
+        
+    Returns:
+        Tuple of (field name, field type)
+    """
+    if field.startswith('"'):
+        closing = field.index('"', 1)
+        return field[1:closing], field[closing + 1:].strip()
+    
+    base_type = field.lower().split('(')[0].replace(' with time zone', '').strip()
+    if ' ' not in field or base_type in TRINO_TO_ARROW_TYPES or base_type in ('array', 'map', 'row', 'decimal'):
+        return f"field{position}", field
+    
+    name, _, field_type = field.partition(' ')
+    return name, field_type.strip()
+
+
+def _arrow_type_and_converter(type_code: str) -> Tuple[pa.DataType, Optional[Callable[[Any], Any]]]:
+    """
+    Resolve a Trino type to an Arrow type and an optional per-value converter.
+    
+    Nested values (arrays, maps, rows) are converted to the layouts pyarrow
+    expects for list, map and struct types; types without an Arrow mapping
+    are converted to strings.
+    
+    Args:
+        type_code: Trino type signature from cursor.description
+        
+    Returns:
+        Tuple of (Arrow type, converter applied to non-NULL values or None)
+    """
+    type_code = str(type_code).strip()
+    lowered = type_code.lower()
+    base_type = lowered.split('(')[0].strip()
+    arguments = type_code[type_code.find('(') + 1:type_code.rfind(')')] if '(' in type_code else ''
+    
+    if base_type == 'array':
+        element_type, element_converter = _arrow_type_and_converter(arguments)
+        if element_converter is None:
+            return pa.list_(element_type), None
+        return pa.list_(element_type), lambda value: [
+            None if item is None else element_converter(item) for item in value
+        ]
+    
+    if base_type == 'map':
+        key_code, value_code = _split_type_arguments(arguments)
+        key_type, key_converter = _arrow_type_and_converter(key_code)
+        value_type, value_converter = _arrow_type_and_converter(value_code)
+        key_converter = key_converter or (lambda key: key)
+        value_converter = value_converter or (lambda item: item)
+        return pa.map_(key_type, value_type), lambda value: [
+            (key_converter(key), None if item is None else value_converter(item))
+            for key, item in value.items()
+        ]
+    
+    if base_type == 'row':
+        fields = [
+            _split_row_field(field, position)
+            for position, field in enumerate(_split_type_arguments(arguments))
+        ]
+        names = [name for name, _ in fields]
+        resolved = [_arrow_type_and_converter(field_type) for _, field_type in fields]
+        converters = [converter or (lambda item: item) for _, converter in resolved]
+        return pa.struct([pa.field(name, arrow_type) for name, (arrow_type, _) in zip(names, resolved)]), lambda value: {
+            name: None if item is None else converter(item)
+            for name, item, converter in zip(names, value, converters)
+        }
+    
+    if base_type == 'decimal':
+        precision, scale = arguments.split(',')
+        return pa.decimal128(int(precision), int(scale)), None
+    
+    if 'with time zone' in lowered:
+        if base_type == 'timestamp':
+            return pa.timestamp('us', tz='UTC'), None
+        return pa.string(), str
+    
+    arrow_type = TRINO_TO_ARROW_TYPES.get(base_type)
+    if arrow_type is not None:
+        return arrow_type, None
+    
+    return pa.string(), str
+
+
+def trino_type_to_arrow(type_code: str) -> pa.DataType:
+    """
+    Map a Trino column type from cursor.description to an Arrow type.
+    
+    Args:
+        type_code: Trino type name, e.g. 'bigint', 'decimal(10,2)', 'map(varchar, integer)'
+        
+    Returns:
+        Matching Arrow type; types without an Arrow mapping map to string
+    """
+    return _arrow_type_and_converter(type_code)[0]
+
+
+def trino_type_to_pandas(type_code: str) -> Union[str, type, pd.ArrowDtype]:
+    """
+    Map a Trino column type from cursor.description to a pandas dtype.
+    
+    Integer and boolean types map to pandas' nullable dtypes so that NULLs do
+    not change the column dtype. DATE maps to an Arrow date32 dtype, matching
+    the Arrow fetch path and keeping calendar dates distinct from timestamps.
+    
+    Args:
+        type_code: Trino type name, e.g. 'bigint', 'decimal(10,2)', 'timestamp(3)'
+        
+    Returns:
+        Matching pandas dtype, or object for types without a mapping
+    """
+    type_code = str(type_code).lower()
+    
+    if 'with time zone' in type_code:
+        return object
+    
+    return TRINO_TO_PANDAS_TYPES.get(type_code.split('(')[0].strip(), object)
+
+
+def _rows_to_dataframe(
+    rows: List[Any],
+    columns: List[str],
+    dtypes: List[Union[str, type, pd.ArrowDtype]]
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from fetched rows, converting each column to its declared dtype.
+    
+    Args:
+        rows: Result rows from the cursor
+        columns: Column names
+        dtypes: pandas dtype per column, as returned by trino_type_to_pandas
+        
+    Returns:
+        DataFrame with one typed column per result column
+    """
+    column_values = list(zip(*rows)) if rows else [()] * len(columns)
+    
+    df = pd.DataFrame({
+        position: pd.Series(list(values), dtype=dtype)
+        for position, (values, dtype) in enumerate(zip(column_values, dtypes))
+    })
+    df.columns = columns
+    return df
+
+
+def _fetch_chunks(cursor: trino.dbapi.Cursor, chunksize: int) -> Iterator[List[Any]]:
+    """
+    Yield the remaining rows of an executed cursor in chunks of at most chunksize rows.
+    
+    Args:
+        cursor: Cursor with an executed query
+        chunksize: Number of rows to fetch per round
+        
+    Yields:
+        Lists of result rows
+    """
+    cursor.arraysize = chunksize
+    
+    while True:
+        rows = cursor.fetchmany(chunksize)
+        if not rows:
+            return
+        yield rows
+
+
+def fetch_arrow_table(cursor: trino.dbapi.Cursor, fetch_size: int = DEFAULT_FETCH_SIZE) -> pa.Table:
+    """
+    Fetch the remaining rows of an executed cursor into a typed Arrow table.
+    
+    Args:
+        cursor: Cursor with an executed query
+        fetch_size: Number of rows to fetch per round
+        
+    Returns:
+        Arrow table with one typed column per result column
+    """
+    description = cursor.description or []
+    names = [desc[0] for desc in description]
+    resolved = [_arrow_type_and_converter(desc[1]) for desc in description]
+    
+    column_chunks = [[] for _ in names]
+    
+    for rows in _fetch_chunks(cursor, fetch_size):
+        for chunks, column_values, (arrow_type, converter) in zip(column_chunks, zip(*rows), resolved):
+            if converter is not None:
+                column_values = [None if value is None else converter(value) for value in column_values]
+            chunks.append(pa.array(column_values, type=arrow_type))
+    
+    columns = [
+        pa.chunked_array(chunks, type=arrow_type)
+        for chunks, (arrow_type, _) in zip(column_chunks, resolved)
+    ]
+    
+    return pa.Table.from_arrays(columns, names=names)
+
+
 def test_catalog_connectivity(connection: trino.dbapi.Connection) -> Dict[str, bool]:
     """
     Test connectivity to all configured Trino catalogs.
@@ -72,22 +547,46 @@ def test_catalog_connectivity(connection: trino.dbapi.Connection) -> Dict[str, b
     Returns:
         Dictionary mapping catalog names to connectivity status
     """
+    schema_counts_query = """
+    SELECT c.catalog_name, COUNT(s.table_schem) as cnt
+    FROM system.metadata.catalogs c
+    LEFT JOIN system.jdbc.schemas s ON s.table_catalog = c.catalog_name
+    GROUP BY c.catalog_name
+    ORDER BY c.catalog_name
+    """
+    
+    try:
+        schema_counts = execute_sql_query(connection, schema_counts_query)
+        catalog_status = schema_counts.set_index('catalog_name')['cnt'].gt(0).to_dict()
+        
+        for catalog, status in catalog_status.items():
+            logger.info(f"Catalog '{catalog}': {'OK' if status else 'FAILED'}")
+        
+        return catalog_status
+        
+    except Exception as e:
+        logger.warning(f"Single-query catalog probe failed, probing catalogs one by one: {e}")
+    
     cursor = connection.cursor()
     catalog_status = {}
     
     try:
         cursor.execute("SHOW CATALOGS")
-        catalogs = [row[0] for row in cursor.fetchall()]
+        catalogs = [row[0] for rows in _fetch_chunks(cursor, DEFAULT_METADATA_FETCH_SIZE) for row in rows]
         
         for catalog in catalogs:
+            # Closing the probe cursor cancels the rest of its SHOW SCHEMAS
+            # query once the first row has been read.
+            probe_cursor = connection.cursor()
             try:
-                cursor.execute(f"SHOW SCHEMAS FROM {catalog}")
-                schemas = cursor.fetchall()
-                catalog_status[catalog] = len(schemas) > 0
+                probe_cursor.execute(f"SHOW SCHEMAS FROM {catalog}")
+                catalog_status[catalog] = next(iter(probe_cursor.fetchmany(1)), None) is not None
                 logger.info(f"Catalog '{catalog}': {'OK' if catalog_status[catalog] else 'FAILED'}")
             except Exception as e:
                 catalog_status[catalog] = False
                 logger.warning(f"Catalog '{catalog}' connectivity failed: {e}")
+            finally:
+                probe_cursor.close()
                 
         return catalog_status
         
@@ -101,19 +600,36 @@ def test_catalog_connectivity(connection: trino.dbapi.Connection) -> Dict[str, b
 def execute_sql_query(
     connection: trino.dbapi.Connection,
     query: str,
-    parameters: Optional[List[Any]] = None
-) -> pd.DataFrame:
+    parameters: Optional[List[Any]] = None,
+    chunksize: int = DEFAULT_FETCH_SIZE,
+    backend: Literal['pandas', 'polars', 'arrow'] = 'pandas'
+) -> Union[pd.DataFrame, pa.Table, "polars.DataFrame"]:
     """
-    Execute SQL query and return results as pandas DataFrame.
+    Execute SQL query and return results as a pandas DataFrame, Arrow table
+    or polars DataFrame.
     
     Args:
         connection: Active Trino connection
         query: SQL query to execute
         parameters: Optional query parameters for parameterized queries
+        chunksize: Number of rows to fetch from Trino per round
+        backend: Result type to build: 'pandas', 'arrow' (typed pyarrow
+            Table built straight from the fetched chunks) or 'polars'
+            (polars DataFrame converted zero-copy from Arrow; requires the
+            optional polars package)
         
     Returns:
-        Query results as pandas DataFrame
+        Query results as pandas DataFrame, pyarrow Table or polars DataFrame
     """
+    if backend not in ('pandas', 'polars', 'arrow'):
+        raise ValueError(f"Unsupported backend: '{backend}'")
+    
+    if backend == 'polars':
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError("polars is required for backend='polars'")
+    
     cursor = connection.cursor()
     
     try:
@@ -121,10 +637,17 @@ def execute_sql_query(
             cursor.execute(query, parameters)
         else:
             cursor.execute(query)
+        
+        if backend != 'pandas':
+            table = fetch_arrow_table(cursor, chunksize)
+            logger.info(f"Query executed successfully, returned {table.num_rows} rows")
+            return pl.from_arrow(table) if backend == 'polars' else table
             
-        columns = [desc[0] for desc in cursor.description] if cursor.description else []
-        rows = cursor.fetchall()
-        df = pd.DataFrame(rows, columns=columns)
+        description = cursor.description or []
+        columns = [desc[0] for desc in description]
+        dtypes = [trino_type_to_pandas(desc[1]) for desc in description]
+        chunks = [_rows_to_dataframe(rows, columns, dtypes) for rows in _fetch_chunks(cursor, chunksize)]
+        df = pd.concat(chunks, ignore_index=True) if chunks else _rows_to_dataframe([], columns, dtypes)
         
         logger.info(f"Query executed successfully, returned {len(df)} rows")
         return df
@@ -136,6 +659,110 @@ def execute_sql_query(
         cursor.close()
 
 
+def iter_sql_query(
+    connection: trino.dbapi.Connection,
+    query: str,
+    parameters: Optional[List[Any]] = None,
+    chunksize: int = DEFAULT_FETCH_SIZE
+) -> Iterator[pd.DataFrame]:
+    """
+    Execute SQL query and stream results as pandas DataFrames of at most chunksize rows.
+    
+    Args:
+        connection: Active Trino connection
+        query: SQL query to execute
+        parameters: Optional query parameters for parameterized queries
+        chunksize: Number of rows per yielded DataFrame
+        
+    Yields:
+        Consecutive chunks of the query results
+    """
+    cursor = connection.cursor()
+    
+    try:
+        if parameters:
+            cursor.execute(query, parameters)
+        else:
+            cursor.execute(query)
+            
+        description = cursor.description or []
+        columns = [desc[0] for desc in description]
+        dtypes = [trino_type_to_pandas(desc[1]) for desc in description]
+        
+        for rows in _fetch_chunks(cursor, chunksize):
+            yield _rows_to_dataframe(rows, columns, dtypes)
+        
+    except Exception as e:
+        logger.error(f"Query execution failed: {e}")
+        raise RuntimeError(f"Could not execute query: {e}")
+    finally:
+        cursor.close()
+
+
+_query_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, pd.DataFrame]]" = OrderedDict()
+_query_cache_lock = threading.Lock()
+
+
+def cached_execute_sql_query(
+    connection: trino.dbapi.Connection,
+    query: str,
+    parameters: Optional[List[Any]] = None,
+    ttl: float = DEFAULT_QUERY_CACHE_TTL_SECONDS
+) -> pd.DataFrame:
+    """
+    Execute SQL query through an in-process LRU cache with a time-to-live.
+    
+    Results are keyed by the connection settings, query and parameters, so
+    repeated metadata probes skip the round-trip to Trino. Passing ttl=0
+    bypasses the cached entry and refreshes it.
+    
+    Args:
+        connection: Active Trino connection
+        query: SQL query to execute
+        parameters: Optional query parameters for parameterized queries
+        ttl: Maximum age in seconds of a cached result that may be reused
+        
+    Returns:
+        Query results as pandas DataFrame
+    """
+    key = (
+        connection.host,
+        connection.port,
+        connection.user,
+        connection.catalog,
+        connection.schema,
+        query,
+        tuple(parameters or ())
+    )
+    now = time.monotonic()
+    
+    if ttl > 0:
+        with _query_cache_lock:
+            entry = _query_cache.get(key)
+            if entry is not None and now - entry[0] < ttl:
+                _query_cache.move_to_end(key)
+                logger.info("Query result served from cache")
+                return entry[1].copy()
+    
+    df = execute_sql_query(connection, query, parameters)
+    
+    with _query_cache_lock:
+        _query_cache[key] = (now, df)
+        _query_cache.move_to_end(key)
+        while len(_query_cache) > DEFAULT_QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    
+    return df.copy()
+
+
+def clear_query_cache() -> None:
+    """
+    Drop all results cached by cached_execute_sql_query.
+    """
+    with _query_cache_lock:
+        _query_cache.clear()
+
+
 def get_catalog_tables(
     connection: trino.dbapi.Connection,
     catalog: str,
@@ -152,17 +779,18 @@ def get_catalog_tables(
     Returns:
         DataFrame with table information
     """
-    if schema:
-        query = f"SHOW TABLES FROM {catalog}.{schema}"
-    else:
-        query = f"""
-        SELECT table_schema, table_name, table_type
-        FROM {catalog}.information_schema.tables
-        WHERE table_type = 'BASE TABLE'
-        ORDER BY table_schema, table_name
-        """
+    if not IDENTIFIER_PATTERN.fullmatch(catalog):
+        raise ValueError(f"Invalid catalog name: {catalog!r}")
+    
+    query = f"""
+    SELECT table_schema, table_name, table_type
+    FROM {catalog}.information_schema.tables
+    WHERE (? IS NULL OR table_schema = ?)
+      AND table_type = 'BASE TABLE'
+    ORDER BY table_schema, table_name
+    """
     
-    return execute_sql_query(connection, query)
+    return execute_sql_query(connection, query, [schema, schema])
 
 
 def test_data_access(connection: trino.dbapi.Connection) -> Dict[str, int]:
@@ -181,30 +809,60 @@ def test_data_access(connection: trino.dbapi.Connection) -> Dict[str, int]:
         "mysql.demo_db.trn_payments": "SELECT COUNT(*) FROM mysql.demo_db.trn_payments"
     }
     
+    def count_rows(query):
+        with sibling_connection(connection) as worker_connection:
+            df = execute_sql_query(worker_connection, query)
+            return df.iloc[0, 0] if not df.empty else 0
+    
     results = {}
     
-    for table_name, query in test_queries.items():
-        try:
-            df = execute_sql_query(connection, query)
-            count = df.iloc[0, 0] if not df.empty else 0
-            results[table_name] = count
-            logger.info(f"Table {table_name}: {count} rows")
-        except Exception as e:
-            logger.warning(f"Failed to access {table_name}: {e}")
-            results[table_name] = -1
+    with ThreadPoolExecutor(max_workers=len(test_queries)) as executor:
+        futures = {
+            table_name: executor.submit(count_rows, query)
+            for table_name, query in test_queries.items()
+        }
+        
+        for table_name, future in futures.items():
+            try:
+                count = future.result()
+                results[table_name] = count
+                logger.info(f"Table {table_name}: {count} rows")
+            except Exception as e:
+                logger.warning(f"Failed to access {table_name}: {e}")
+                results[table_name] = -1
             
     return results
 
 
 def close_connection(connection: trino.dbapi.Connection) -> None:
     """
-    Safely close Trino connection.
+    Safely release a Trino connection.
+    
+    Pooled connections are returned to their pool rather than closed; call
+    close_all_connections to close the pooled connections for good.
     
     Args:
-        connection: Trino connection to close
+        connection: Trino connection to release
     """
     try:
         connection.close()
-        logger.info("Trino connection closed successfully")
+        if isinstance(connection, PooledTrinoConnection):
+            logger.info("Trino connection returned to pool")
+        else:
+            logger.info("Trino connection closed successfully")
     except Exception as e:
-        logger.warning(f"Error closing connection: {e}")
\ No newline at end of file
+        logger.warning(f"Error closing connection: {e}")
+
+
+def close_all_connections() -> None:
+    """
+    Close every idle pooled Trino connection and drop the pools.
+    """
+    with _connection_pools_lock:
+        pools = list(_connection_pools.values())
+        _connection_pools.clear()
+    
+    for pool in pools:
+        pool.close_all()
+    
+    logger.info("All pooled Trino connections closed")
\ No newline at end of file
@@ -1,9 +1,11 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import seaborn as sns
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, Union
 import logging
+from dataclasses import dataclass
 from datetime import datetime, date
 
 logging.basicConfig(level=logging.INFO)
@@ -15,6 +17,91 @@ sns.set_palette("husl")
 DEFAULT_FIGSIZE = (12, 6)
 DEFAULT_BINS = 20
 DEFAULT_DPI = 300
+INTERMEDIATE_DPI = 150
+
+_DOLLAR_FMT = plt.FuncFormatter(lambda x, _: f'${x:,.0f}')
+_PCT_FMT = plt.FuncFormatter(lambda x, _: f'{x:.0%}')
+
+
+@dataclass(frozen=True)
+class ChartStats:
+    """Summary statistics shown on the analytics dashboard."""
+    revenue_mean: float
+    revenue_max: float
+    revenue_sum: float
+    coverage_mean: float
+    orders_mean: float
+    orders_sum: int
+    n_days: int
+    n_full_coverage: int
+
+
+def _compute_stats(df: pd.DataFrame) -> ChartStats:
+    """
+    Compute the dashboard statistics in a single aggregation pass.
+    
+    Args:
+        df: DataFrame with revenue, orders_cnt and payment_coverage columns
+        
+    Returns:
+        ChartStats for the DataFrame
+    """
+    agg = df.agg({
+        'revenue': ['mean', 'max', 'sum'],
+        'payment_coverage': ['mean'],
+        'orders_cnt': ['mean', 'sum'],
+    })
+    
+    return ChartStats(
+        revenue_mean=float(agg.at['mean', 'revenue']),
+        revenue_max=float(agg.at['max', 'revenue']),
+        revenue_sum=float(agg.at['sum', 'revenue']),
+        coverage_mean=float(agg.at['mean', 'payment_coverage']),
+        orders_mean=float(agg.at['mean', 'orders_cnt']),
+        orders_sum=int(agg.at['sum', 'orders_cnt']),
+        n_days=len(df),
+        n_full_coverage=int((df['payment_coverage'] >= 1.0).sum()),
+    )
+
+
+def _as_chart_stats(stats: Union[ChartStats, Dict[str, Any]]) -> ChartStats:
+    """Build ChartStats from a summary dict such as data_aggregation.fetch_dashboard_data returns."""
+    if isinstance(stats, ChartStats):
+        return stats
+    
+    return ChartStats(
+        revenue_mean=float(stats['revenue_mean']),
+        revenue_max=float(stats['revenue_max']),
+        revenue_sum=float(stats['revenue_sum']),
+        coverage_mean=float(stats['coverage_mean']),
+        orders_mean=float(stats['orders_mean']),
+        orders_sum=int(stats['orders_sum']),
+        n_days=int(stats['n_days']),
+        n_full_coverage=int(stats['n_full_coverage']),
+    )
+
+
+def _to_datetime(values: pd.Series) -> pd.Series:
+    """Return the values as datetime64, skipping the conversion when they already are."""
+    if pd.api.types.is_datetime64_any_dtype(values.dtype) and isinstance(values.dtype, np.dtype):
+        return values
+    return pd.to_datetime(values, errors='raise', cache=True)
+
+
+def _save_figure(fig: plt.Figure, save_path: str, dpi: int, bbox_inches: Any = 'tight') -> None:
+    """Save a figure, letting Pillow optimize the encoding for PNG output."""
+    savefig_kwargs = {}
+    if save_path.lower().endswith('.png'):
+        savefig_kwargs['pil_kwargs'] = {'optimize': True}
+    fig.savefig(save_path, dpi=dpi, bbox_inches=bbox_inches, **savefig_kwargs)
+
+
+def _save_axes(fig: plt.Figure, label: str, save_path: str, dpi: int) -> None:
+    """Save the single panel of ``fig`` labelled ``label`` as its own image."""
+    ax = next(ax for ax in fig.axes if ax.get_label() == label)
+    renderer = fig.canvas.get_renderer()
+    extent = ax.get_tightbbox(renderer).transformed(fig.dpi_scale_trans.inverted())
+    _save_figure(fig, save_path, dpi, bbox_inches=extent.expanded(1.02, 1.02))
 
 
 def create_time_series_revenue_chart(
@@ -23,7 +110,8 @@ def create_time_series_revenue_chart(
     revenue_column: str = 'revenue',
     figsize: Tuple[int, int] = DEFAULT_FIGSIZE,
     title: str = "Daily Revenue Time Series",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    dpi: int = DEFAULT_DPI
 ) -> plt.Figure:
     """
     Generate a professional time-series chart for revenue data.
@@ -35,6 +123,7 @@ def create_time_series_revenue_chart(
         figsize: Figure size as (width, height)
         title: Chart title
         save_path: Optional path to save the chart
+        dpi: Resolution used when saving the chart
         
     Returns:
         Matplotlib figure object
@@ -51,7 +140,7 @@ def create_time_series_revenue_chart(
     try:
         fig, ax = plt.subplots(figsize=figsize)
         
-        dates = pd.to_datetime(df[date_column])
+        dates = _to_datetime(df[date_column])
         revenue = df[revenue_column]
         
         ax.plot(dates, revenue, 
@@ -61,16 +150,18 @@ def create_time_series_revenue_chart(
                 color='#2E86AB',
                 markerfacecolor='#A23B72',
                 markeredgecolor='white',
-                markeredgewidth=1)
+                markeredgewidth=1,
+                rasterized=True)
         
         ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
         ax.set_xlabel('Date', fontsize=12, fontweight='bold')
         ax.set_ylabel('Revenue ($)', fontsize=12, fontweight='bold')
         
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+        ax.yaxis.set_major_formatter(_DOLLAR_FMT)
         
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
+        date_locator = mdates.AutoDateLocator(minticks=5, maxticks=10)
+        ax.xaxis.set_major_locator(date_locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(date_locator))
         
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
@@ -90,7 +181,7 @@ def create_time_series_revenue_chart(
         plt.tight_layout()
         
         if save_path:
-            fig.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+            _save_figure(fig, save_path, dpi)
             logger.info(f"Chart saved to {save_path}")
         
         logger.info(f"Time-series revenue chart created with {len(df)} data points")
@@ -107,7 +198,8 @@ def create_payment_coverage_histogram(
     bins: int = DEFAULT_BINS,
     figsize: Tuple[int, int] = (10, 6),
     title: str = "Payment Coverage Distribution",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    dpi: int = DEFAULT_DPI
 ) -> plt.Figure:
     """
     Generate a professional histogram for payment coverage distribution.
@@ -119,6 +211,7 @@ def create_payment_coverage_histogram(
         figsize: Figure size as (width, height)
         title: Chart title
         save_path: Optional path to save the chart
+        dpi: Resolution used when saving the chart
         
     Returns:
         Matplotlib figure object
@@ -144,26 +237,24 @@ def create_payment_coverage_histogram(
                                         edgecolor='black',
                                         linewidth=0.5)
         
-        for i, patch in enumerate(patches):
-            bin_center = (bins_edges[i] + bins_edges[i+1]) / 2
-            if bin_center >= 0.9:
-                patch.set_facecolor('#2E8B57')
-            elif bin_center >= 0.7:
-                patch.set_facecolor('#FFD700')
-            else:
-                patch.set_facecolor('#DC143C')
+        bin_centers = 0.5 * (bins_edges[:-1] + bins_edges[1:])
+        bin_colors = np.where(bin_centers >= 0.9, '#2E8B57',
+                              np.where(bin_centers >= 0.7, '#FFD700', '#DC143C'))
+        
+        for patch, color in zip(patches, bin_colors):
+            patch.set_facecolor(color)
         
         ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
         ax.set_xlabel('Payment Coverage Ratio', fontsize=12, fontweight='bold')
         ax.set_ylabel('Frequency (Number of Days)', fontsize=12, fontweight='bold')
         
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.0%}'))
+        ax.xaxis.set_major_formatter(_PCT_FMT)
         
         percentiles = [0.25, 0.5, 0.75]
         colors = ['red', 'orange', 'green']
+        quantiles = coverage_data.quantile(percentiles).to_numpy(dtype=np.float64)
         
-        for percentile, color in zip(percentiles, colors):
-            value = coverage_data.quantile(percentile)
+        for percentile, value, color in zip(percentiles, quantiles, colors):
             ax.axvline(value, color=color, linestyle='--', alpha=0.7, linewidth=2)
             ax.text(value, ax.get_ylim()[1] * 0.9, 
                    f'{percentile*100:.0f}th: {value:.1%}',
@@ -194,7 +285,7 @@ def create_payment_coverage_histogram(
         plt.tight_layout()
         
         if save_path:
-            fig.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+            _save_figure(fig, save_path, dpi)
             logger.info(f"Chart saved to {save_path}")
         
         logger.info(f"Payment coverage histogram created with {len(coverage_data)} data points")
@@ -209,7 +300,9 @@ def create_combined_analytics_dashboard(
     df: pd.DataFrame,
     figsize: Tuple[int, int] = (16, 12),
     title: str = "Analytics Dashboard",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    dpi: int = DEFAULT_DPI,
+    stats: Optional[Union[ChartStats, Dict[str, Any]]] = None
 ) -> plt.Figure:
     """
     Create a comprehensive analytics dashboard with multiple visualizations.
@@ -219,6 +312,9 @@ def create_combined_analytics_dashboard(
         figsize: Figure size as (width, height)
         title: Dashboard title
         save_path: Optional path to save the dashboard
+        dpi: Resolution used when saving the dashboard
+        stats: Optional precomputed statistics, as ChartStats or a summary dict
+            from fetch_dashboard_data; computed from df if omitted
         
     Returns:
         Matplotlib figure object
@@ -233,64 +329,76 @@ def create_combined_analytics_dashboard(
         raise ValueError("DataFrame is empty")
     
     try:
-        fig, axes = plt.subplots(2, 3, figsize=figsize)
+        fig, axd = plt.subplot_mosaic(
+            [['rev', 'ord', 'cov'],
+             ['scat', 'hist', 'stats']],
+            figsize=figsize
+        )
         fig.suptitle(title, fontsize=20, fontweight='bold', y=0.98)
         
-        dates = pd.to_datetime(df['dt'])
-        
-        axes[0, 0].plot(dates, df['revenue'], marker='o', linewidth=2, color='#2E86AB')
-        axes[0, 0].set_title('Daily Revenue', fontweight='bold')
-        axes[0, 0].set_ylabel('Revenue ($)')
-        axes[0, 0].yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-        axes[0, 0].grid(True, alpha=0.3)
-        axes[0, 0].tick_params(axis='x', rotation=45)
-        
-        axes[0, 1].plot(dates, df['orders_cnt'], marker='s', linewidth=2, color='#A23B72')
-        axes[0, 1].set_title('Daily Orders Count', fontweight='bold')
-        axes[0, 1].set_ylabel('Orders Count')
-        axes[0, 1].grid(True, alpha=0.3)
-        axes[0, 1].tick_params(axis='x', rotation=45)
-        
-        axes[0, 2].plot(dates, df['payment_coverage'], marker='^', linewidth=2, color='#F18F01')
-        axes[0, 2].set_title('Payment Coverage', fontweight='bold')
-        axes[0, 2].set_ylabel('Coverage Ratio')
-        axes[0, 2].yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.0%}'))
-        axes[0, 2].grid(True, alpha=0.3)
-        axes[0, 2].tick_params(axis='x', rotation=45)
-        
-        axes[1, 0].scatter(df['revenue'], df['paid_amount'], alpha=0.6, color='#C73E1D')
-        axes[1, 0].set_title('Revenue vs Paid Amount', fontweight='bold')
-        axes[1, 0].set_xlabel('Revenue ($)')
-        axes[1, 0].set_ylabel('Paid Amount ($)')
-        axes[1, 0].xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-        axes[1, 0].yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-        
-        max_val = max(df['revenue'].max(), df['paid_amount'].max())
-        axes[1, 0].plot([0, max_val], [0, max_val], 'k--', alpha=0.5, label='Perfect Coverage')
-        axes[1, 0].legend()
-        axes[1, 0].grid(True, alpha=0.3)
-        
-        axes[1, 1].hist(df['payment_coverage'], bins=15, alpha=0.7, color='#3F88C5', edgecolor='black')
-        axes[1, 1].set_title('Payment Coverage Distribution', fontweight='bold')
-        axes[1, 1].set_xlabel('Coverage Ratio')
-        axes[1, 1].set_ylabel('Frequency')
-        axes[1, 1].xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.0%}'))
-        axes[1, 1].grid(True, alpha=0.3, axis='y')
-        
-        axes[1, 2].axis('off')
+        dates = _to_datetime(df['dt']).to_numpy()
+        revenue = df['revenue'].to_numpy(dtype=np.float64, na_value=np.nan)
+        orders = df['orders_cnt'].to_numpy()
+        coverage = df['payment_coverage'].to_numpy(dtype=np.float64, na_value=np.nan)
+        paid = df['paid_amount'].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        stats = _compute_stats(df) if stats is None else _as_chart_stats(stats)
+        
+        axd['rev'].plot(dates, revenue, marker='o', linewidth=2, color='#2E86AB', rasterized=True)
+        axd['rev'].set_title('Daily Revenue', fontweight='bold')
+        axd['rev'].set_label('revenue_timeseries')
+        axd['rev'].set_ylabel('Revenue ($)')
+        axd['rev'].yaxis.set_major_formatter(_DOLLAR_FMT)
+        axd['rev'].grid(True, alpha=0.3)
+        axd['rev'].tick_params(axis='x', rotation=45)
+        
+        axd['ord'].plot(dates, orders, marker='s', linewidth=2, color='#A23B72', rasterized=True)
+        axd['ord'].set_title('Daily Orders Count', fontweight='bold')
+        axd['ord'].set_ylabel('Orders Count')
+        axd['ord'].grid(True, alpha=0.3)
+        axd['ord'].tick_params(axis='x', rotation=45)
+        
+        axd['cov'].plot(dates, coverage, marker='^', linewidth=2, color='#F18F01', rasterized=True)
+        axd['cov'].set_title('Payment Coverage', fontweight='bold')
+        axd['cov'].set_ylabel('Coverage Ratio')
+        axd['cov'].yaxis.set_major_formatter(_PCT_FMT)
+        axd['cov'].grid(True, alpha=0.3)
+        axd['cov'].tick_params(axis='x', rotation=45)
+        
+        axd['scat'].scatter(revenue, paid, alpha=0.6, color='#C73E1D', rasterized=True)
+        axd['scat'].set_title('Revenue vs Paid Amount', fontweight='bold')
+        axd['scat'].set_xlabel('Revenue ($)')
+        axd['scat'].set_ylabel('Paid Amount ($)')
+        axd['scat'].xaxis.set_major_formatter(_DOLLAR_FMT)
+        axd['scat'].yaxis.set_major_formatter(_DOLLAR_FMT)
+        
+        max_val = max(stats.revenue_max, np.nanmax(paid))
+        axd['scat'].plot([0, max_val], [0, max_val], 'k--', alpha=0.5, label='Perfect Coverage')
+        axd['scat'].legend()
+        axd['scat'].grid(True, alpha=0.3)
+        
+        axd['hist'].hist(coverage, bins=15, alpha=0.7, color='#3F88C5', edgecolor='black')
+        axd['hist'].set_title('Payment Coverage Distribution', fontweight='bold')
+        axd['hist'].set_label('payment_coverage_histogram')
+        axd['hist'].set_xlabel('Coverage Ratio')
+        axd['hist'].set_ylabel('Frequency')
+        axd['hist'].xaxis.set_major_formatter(_PCT_FMT)
+        axd['hist'].grid(True, alpha=0.3, axis='y')
+        
+        axd['stats'].axis('off')
         
         stats_data = [
             ['Metric', 'Value'],
-            ['Total Days', f"{len(df)}"],
-            ['Avg Daily Revenue', f"${df['revenue'].mean():,.0f}"],
-            ['Total Revenue', f"${df['revenue'].sum():,.0f}"],
-            ['Avg Daily Orders', f"{df['orders_cnt'].mean():.1f}"],
-            ['Total Orders', f"{df['orders_cnt'].sum():,}"],
-            ['Avg Coverage', f"{df['payment_coverage'].mean():.1%}"],
-            ['Days w/ Full Coverage', f"{(df['payment_coverage'] >= 1.0).sum()}"]
+            ['Total Days', f"{stats.n_days}"],
+            ['Avg Daily Revenue', f"${stats.revenue_mean:,.0f}"],
+            ['Total Revenue', f"${stats.revenue_sum:,.0f}"],
+            ['Avg Daily Orders', f"{stats.orders_mean:.1f}"],
+            ['Total Orders', f"{stats.orders_sum:,}"],
+            ['Avg Coverage', f"{stats.coverage_mean:.1%}"],
+            ['Days w/ Full Coverage', f"{stats.n_full_coverage}"]
         ]
         
-        table = axes[1, 2].table(cellText=stats_data[1:], 
+        table = axd['stats'].table(cellText=stats_data[1:], 
                                 colLabels=stats_data[0],
                                 cellLoc='center',
                                 loc='center',
@@ -309,13 +417,13 @@ def create_combined_analytics_dashboard(
                 else:
                     cell.set_facecolor('#F2F2F2' if i % 2 == 0 else 'white')
         
-        axes[1, 2].set_title('Summary Statistics', fontweight='bold')
+        axd['stats'].set_title('Summary Statistics', fontweight='bold')
         
         plt.tight_layout()
         plt.subplots_adjust(top=0.93)
         
         if save_path:
-            fig.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight')
+            _save_figure(fig, save_path, dpi)
             logger.info(f"Dashboard saved to {save_path}")
         
         logger.info(f"Analytics dashboard created with {len(df)} data points")
@@ -329,15 +437,21 @@ def create_combined_analytics_dashboard(
 def save_all_charts(
     df: pd.DataFrame,
     output_dir: str = "charts",
-    file_format: str = "png"
+    file_format: str = "png",
+    stats: Optional[Union[ChartStats, Dict[str, Any]]] = None
 ) -> Dict[str, str]:
     """
     Generate and save all chart types to specified directory.
     
+    The dashboard is rendered once; the revenue time-series and coverage
+    histogram files are cropped from its panels.
+    
     Args:
         df: DataFrame containing analytics data
         output_dir: Directory to save charts
         file_format: File format for saved charts (png, jpg, pdf, svg)
+        stats: Optional precomputed dashboard statistics, as ChartStats or a
+            summary dict from fetch_dashboard_data; computed from df if omitted
         
     Returns:
         Dictionary mapping chart names to file paths
@@ -349,19 +463,17 @@ def save_all_charts(
         
         saved_files = {}
         
-        revenue_path = os.path.join(output_dir, f"revenue_timeseries.{file_format}")
-        fig1 = create_time_series_revenue_chart(df, save_path=revenue_path)
-        plt.close(fig1)
-        saved_files['revenue_timeseries'] = revenue_path
+        dashboard_path = os.path.join(output_dir, f"analytics_dashboard.{file_format}")
+        fig = create_combined_analytics_dashboard(df, save_path=dashboard_path, stats=stats)
         
-        coverage_path = os.path.join(output_dir, f"payment_coverage_histogram.{file_format}")
-        fig2 = create_payment_coverage_histogram(df, save_path=coverage_path)
-        plt.close(fig2)
-        saved_files['payment_coverage_histogram'] = coverage_path
+        try:
+            for chart_name in ('revenue_timeseries', 'payment_coverage_histogram'):
+                chart_path = os.path.join(output_dir, f"{chart_name}.{file_format}")
+                _save_axes(fig, chart_name, chart_path, INTERMEDIATE_DPI)
+                saved_files[chart_name] = chart_path
+        finally:
+            plt.close(fig)
         
-        dashboard_path = os.path.join(output_dir, f"analytics_dashboard.{file_format}")
-        fig3 = create_combined_analytics_dashboard(df, save_path=dashboard_path)
-        plt.close(fig3)
         saved_files['analytics_dashboard'] = dashboard_path
         
         logger.info(f"All charts saved to {output_dir}")
@@ -379,11 +491,17 @@ def display_chart_summary(df: pd.DataFrame) -> None:
     Args:
         df: DataFrame containing analytics data
     """
+    stats = df.agg({
+        'dt': ['min', 'max'],
+        'revenue': ['min', 'max'],
+        'payment_coverage': ['min', 'max', 'mean'],
+    })
+    
     print("📊 Chart Data Summary")
     print("=" * 50)
     print(f"Data points: {len(df)}")
-    print(f"Date range: {df['dt'].min()} to {df['dt'].max()}")
-    print(f"Revenue range: ${df['revenue'].min():,.2f} - ${df['revenue'].max():,.2f}")
-    print(f"Coverage range: {df['payment_coverage'].min():.1%} - {df['payment_coverage'].max():.1%}")
-    print(f"Average coverage: {df['payment_coverage'].mean():.1%}")
+    print(f"Date range: {stats.at['min', 'dt']} to {stats.at['max', 'dt']}")
+    print(f"Revenue range: ${stats.at['min', 'revenue']:,.2f} - ${stats.at['max', 'revenue']:,.2f}")
+    print(f"Coverage range: {stats.at['min', 'payment_coverage']:.1%} - {stats.at['max', 'payment_coverage']:.1%}")
+    print(f"Average coverage: {stats.at['mean', 'payment_coverage']:.1%}")
     print("=" * 50)
\ No newline at end of file